@@ -9,6 +9,18 @@ import sys
 import urllib.request
 from pathlib import Path
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None  # optional; falls back to urllib
+
+# Bytes read from the socket per call; urlretrieve's default of 8 KiB means many more round trips
+READ_DATA_CHUNK = 128 * 1024
+# Minimum bytes between progress updates
+PROGRESS_INTERVAL = 1 << 20
+
 
 def download_file(url: str, destination: str) -> bool:
     """Download a file from URL to destination."""
@@ -19,13 +31,19 @@ def download_file(url: str, destination: str) -> bool:
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(destination) if os.path.dirname(destination) else ".", exist_ok=True)
         
-        # Download with progress
-        def show_progress(block_num, block_size, total_size):
-            downloaded = block_num * block_size
-            percent = min(downloaded * 100 / total_size, 100) if total_size > 0 else 0
-            print(f"\rProgress: {percent:.1f}%", end="", flush=True)
-        
-        urllib.request.urlretrieve(url, destination, show_progress)
+        if requests is not None:
+            # One keep-alive session serves the redirect chain and any retries
+            with _create_session() as session:
+                with session.get(url, stream=True, timeout=30, headers={"Accept-Encoding": "identity"}) as response:
+                    response.raise_for_status()
+                    total_size = int(response.headers.get("Content-Length") or 0)
+                    with open(destination, "wb") as out:
+                        copy_with_progress(response.raw, out, total_size)
+        else:
+            request = urllib.request.Request(url, headers={"Accept-Encoding": "identity"})
+            with urllib.request.urlopen(request) as response, open(destination, "wb") as out:
+                total_size = int(response.headers.get("Content-Length") or 0)
+                copy_with_progress(response, out, total_size)
         print("\n✓ Download complete!")
         return True
     except Exception as e:
@@ -33,6 +51,41 @@ def download_file(url: str, destination: str) -> bool:
         return False
 
 
+def _create_session() -> "requests.Session":
+    """Create a requests session that retries transient failures on pooled connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=2,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504)),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def copy_with_progress(source, out, total_size: int) -> None:
+    """Copy a binary stream in large chunks, reporting progress at most once per MiB."""
+    downloaded = 0
+    last_report = 0
+    while chunk := source.read(READ_DATA_CHUNK):
+        out.write(chunk)
+        downloaded += len(chunk)
+        if downloaded - last_report >= PROGRESS_INTERVAL:
+            last_report = downloaded
+            show_progress(downloaded, total_size)
+    show_progress(downloaded, total_size)
+
+
+def show_progress(downloaded: int, total_size: int) -> None:
+    """Print download progress on a single line."""
+    if total_size > 0:
+        percent = min(downloaded * 100 / total_size, 100)
+        print(f"\rProgress: {percent:.1f}%", end="", flush=True)
+    else:
+        print(f"\rDownloaded: {downloaded / (1 << 20):.1f} MiB", end="", flush=True)
+
+
 def main():
     print("=" * 50)
     print("Hive JDBC Driver Download Helper")
@@ -1,10 +1,22 @@
+import atexit
+import copy
+import functools
+import json
 import logging
 import os
+import queue
 import shutil
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
 
-import yaml
+from yaml_loader import safe_load, safe_load_entry
 
 try:
     import jaydebeapi
@@ -18,87 +30,348 @@ try:
 except ImportError:
     jpype = None  # jpype might not be directly importable, but jaydebeapi uses it internally
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None  # optional, only needed for run_hive_query_arrow
+
+try:
+    from impala.dbapi import connect as impala_connect
+except ImportError:
+    impala_connect = None  # optional, only needed for protocol: thrift
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional, speeds up reading JSON configs
+
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when the config doesn't set fetch_size
+DEFAULT_FETCH_SIZE = 10000
+
+# Parsed configs keyed by (absolute path, tag) -> (mtime_ns, size, parsed value); tag None is the whole document
+_CONFIG_CACHE: "OrderedDict[Tuple[str, Optional[str]], Tuple[int, int, Any]]" = OrderedDict()
+_CONFIG_CACHE_MAX = 100
+_CONFIG_CACHE_LOCK = threading.Lock()
 
+# Set HIVE_CONFIG_DISK_CACHE=1 to keep a JSON copy of each parsed config next to it (<config>.cache.json)
+_DISK_CACHE_ENV = "HIVE_CONFIG_DISK_CACHE"
+
+_REQUIRED_KEYS = frozenset({"hive_jdbc_url", "hive_driver_class", "username", "password"})
+
+# JVM options used when this module starts the JVM (class data sharing + G1 for fast startup)
+_JVM_OPTIONS = ("-Xshare:auto", "-XX:+UseG1GC")
+# Classpath entries the JVM was started with by _ensure_jvm
+_JVM_CLASSPATH: List[str] = []
+# Serializes JVM startup between threads (concurrent queries, background warm-up)
+_JVM_LOCK = threading.Lock()
+
+# SSL settings last applied to the JVM, so repeated connects can skip the JNI calls
+_LAST_SSL_KEY: Optional[Tuple[Any, ...]] = None
+# Serializes writes of the JVM-global javax.net.ssl.* properties between threads
+_SSL_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
 def check_java_available() -> bool:
     """
-    Check if Java is installed and available in the system PATH.
+    Check if a JVM that JPype can load is installed.
+    Uses JPype's own JVM lookup (JAVA_HOME and platform defaults), which is what
+    JayDeBeApi will actually load; falls back to searching PATH for ``java`` if
+    JPype is not importable. The result is cached for the lifetime of the process.
 
     Returns
     -------
     bool
         True if Java is available, False otherwise.
     """
-    java_path = shutil.which("java")
-    if java_path:
-        logger.info("Java found at: %s", java_path)
-        return True
-    logger.warning("Java not found in PATH. JayDeBeApi requires Java to be installed.")
-    return False
+    if jpype is None:
+        java_path = shutil.which("java")
+        if java_path:
+            logger.info("Java found at: %s", java_path)
+            return True
+        logger.warning("Java not found in PATH. JayDeBeApi requires Java to be installed.")
+        return False
+
+    try:
+        jvm_path = jpype.getDefaultJVMPath()
+    except (jpype.JVMNotFoundException, jpype.JVMNotSupportedException):
+        logger.warning("No usable JVM found (check JAVA_HOME). JayDeBeApi requires Java to be installed.")
+        return False
+    logger.info("JVM found at: %s", jvm_path)
+    return True
+
+
+def _dump_json(value: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode("utf-8")
 
 
-def load_config(config_path: str = "config.yaml", tag: Optional[str] = None) -> Dict[str, Any]:
+def _read_disk_cache(cache_path: str, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Return the cached config document if it was written for the current file version."""
+    try:
+        with open(cache_path, "rb") as f:
+            data = f.read()
+        cached = orjson.loads(data) if orjson is not None else json.loads(data)
+        mtime_ns, size, document = cached["mtime_ns"], cached["size"], cached["config"]
+    except FileNotFoundError:
+        return None
+    except Exception:  # noqa: BLE001
+        logger.debug("Ignoring unreadable config cache '%s'", cache_path, exc_info=True)
+        return None
+    if mtime_ns != st.st_mtime_ns or size != st.st_size:
+        return None
+    return document
+
+
+def _write_disk_cache(cache_path: str, st: os.stat_result, document: Dict[str, Any]) -> None:
+    """Atomically write the parsed config document next to the YAML file as JSON."""
+    try:
+        data = _dump_json({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "config": document})
+        # orjson happily writes dates as strings; only cache what reads back unchanged
+        if json.loads(data)["config"] != document:
+            raise ValueError("config does not round-trip through JSON")
+    except (TypeError, ValueError):
+        # YAML-only values (dates, non-string keys, ...) have no JSON form; just don't cache
+        logger.debug("Config '%s' is not JSON-serializable; skipping disk cache", cache_path, exc_info=True)
+        return
+
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        # The cache holds passwords from the config; never make it more readable than owner-only
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600 & st.st_mode)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        logger.debug("Could not write config cache '%s'", cache_path, exc_info=True)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _cache_get(key: Tuple[str, Optional[str]], st: os.stat_result) -> Any:
+    """Return the cached value for key if it was parsed from the current file version, else None."""
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _CONFIG_CACHE.move_to_end(key)
+            return cached[2]
+    return None
+
+
+def _cache_put(key: Tuple[str, Optional[str]], st: os.stat_result, value: Any) -> None:
+    """Store a parsed value, evicting the least recently used entry when full."""
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, value)
+        _CONFIG_CACHE.move_to_end(key)
+        if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.popitem(last=False)
+
+
+def _is_json_config(path: str) -> bool:
+    """Return True if the config file is JSON rather than YAML (by its .json extension)."""
+    return path.lower().endswith(".json")
+
+
+def _read_json_config(json_path: str) -> Dict[str, Any]:
+    """Parse a JSON config file, using orjson when it is installed."""
+    with open(json_path, "rb") as f:
+        data = f.read()
+    document = orjson.loads(data) if orjson is not None else json.loads(data)
+    logger.info("Loaded configuration from JSON file: %s", json_path)
+    return document or {}
+
+
+def _load_config_document(config_path: str) -> Dict[str, Any]:
+    """
+    Parse a YAML (or .json) config file, reusing the cached document while the file is unchanged.
+
+    Parameters
+    ----------
+    config_path : str
+        Path to the configuration file.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The parsed (shared, not copied) document.
+    """
+    abs_path = os.path.abspath(config_path)
+    st = os.stat(abs_path)
+
+    document = _cache_get((abs_path, None), st)
+    if document is not None:
+        return document
+
+    if _is_json_config(abs_path):
+        document = _read_json_config(abs_path)
+        _cache_put((abs_path, None), st, document)
+        return document
+
+    disk_cache = os.environ.get(_DISK_CACHE_ENV) == "1"
+    cache_path = abs_path + ".cache.json"
+    document = _read_disk_cache(cache_path, st) if disk_cache else None
+    if document is None:
+        with open(abs_path, "r", encoding="utf-8") as f:
+            document = safe_load(f) or {}
+        if disk_cache:
+            _write_disk_cache(cache_path, st, document)
+
+    _cache_put((abs_path, None), st, document)
+    return document
+
+
+def _load_tagged_config(config_path: str, tag: str) -> Tuple[Any, List[Any]]:
+    """
+    Load the settings stored under one tag, reusing cached results while the file is unchanged.
+
+    Only the requested tag is constructed from YAML unless the whole document
+    is already cached, the on-disk cache is enabled, or the config is JSON.
+
+    Parameters
+    ----------
+    config_path : str
+        Path to the YAML configuration file.
+    tag : str
+        Top-level tag to load.
+
+    Returns
+    -------
+    Tuple[Any, List[Any]]
+        The (shared, not copied) value under the tag, or None if absent, and
+        the list of tags available in the file.
+    """
+    abs_path = os.path.abspath(config_path)
+    st = os.stat(abs_path)
+
+    entry = _cache_get((abs_path, tag), st)
+    if entry is not None:
+        return entry
+
+    use_document = (
+        _cache_get((abs_path, None), st) is not None
+        or os.environ.get(_DISK_CACHE_ENV) == "1"
+        or _is_json_config(abs_path)
+    )
+    if use_document:
+        document = _load_config_document(config_path)
+        entry = (document.get(tag), list(document)) if isinstance(document, dict) else (None, [])
+    else:
+        with open(abs_path, "r", encoding="utf-8") as f:
+            entry = safe_load_entry(f, tag)
+
+    _cache_put((abs_path, tag), st, entry)
+    return entry
+
+
+def load_config(
+    config_path: str = "config.yaml",
+    tag: Optional[str] = None,
+    mutable: bool = False,
+) -> Mapping[str, Any]:
     """
     Load Hive connection configuration from a YAML file.
     Supports both flat config structure and named tag-based configurations.
+    A config path ending in .json is parsed as JSON with the same structure.
 
     Parameters
     ----------
     config_path : str
-        Path to the YAML configuration file.
+        Path to the YAML (or JSON) configuration file.
     tag : Optional[str]
         Tag name to load specific configuration. If None, loads flat config structure.
+    mutable : bool
+        If True, return a private deep copy that the caller may modify. By default
+        a read-only view of the cached configuration is returned.
 
     Returns
     -------
-    Dict[str, Any]
-        Dictionary with configuration values for the specified tag or flat config.
+    Mapping[str, Any]
+        Configuration values for the specified tag or flat config.
     """
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            all_configs = yaml.safe_load(f) or {}
+        if tag:
+            config, tags = _load_tagged_config(config_path, tag)
+        else:
+            config = _load_config_document(config_path)
     except FileNotFoundError as exc:
         logger.error("Config file not found at path '%s'", config_path)
         raise FileNotFoundError(f"Config file not found: {config_path}") from exc
 
     # If tag is specified, load that specific configuration
     if tag:
-        if tag not in all_configs:
-            available_tags = ", ".join(all_configs.keys()) if all_configs else "none"
+        if tag not in tags:
+            available_tags = ", ".join(map(str, tags)) if tags else "none"
             raise ValueError(
                 f"Tag '{tag}' not found in config file '{config_path}'. "
                 f"Available tags: {available_tags}"
             )
-        config = all_configs[tag]
         if not isinstance(config, dict):
             raise ValueError(f"Tag '{tag}' in config file must contain a dictionary of settings")
         logger.info("Loaded configuration for tag '%s'", tag)
-    else:
-        # Load flat config structure (backward compatibility)
-        config = all_configs
 
-    # Validate required keys
-    required_keys = ["hive_jdbc_url", "hive_driver_class", "username", "password"]
-    missing = [k for k in required_keys if k not in config]
+    # Validate required keys; a flat config that isn't a mapping has none of them
+    missing = _REQUIRED_KEYS - config.keys() if isinstance(config, dict) else _REQUIRED_KEYS
     if missing:
         tag_info = f" (tag: {tag})" if tag else ""
         raise ValueError(
-            f"Missing required config keys in {config_path}{tag_info}: {', '.join(missing)}"
+            f"Missing required config keys in {config_path}{tag_info}: {', '.join(sorted(missing))}"
         )
 
-    return config
+    if mutable:
+        return copy.deepcopy(config)
+    # Read-only view so callers can't mutate the cached document
+    return MappingProxyType(config)
 
 
-def get_query_from_config(config: Dict[str, Any], config_path: str = "config.yaml") -> str:
+def resolve_config_dir(config_path: str) -> Path:
+    """
+    Return the absolute, symlink-resolved directory containing a config file.
+
+    Resolving walks every ancestor directory, so the result is cached per
+    absolute config path; relative paths in the config are joined onto it lexically.
+
+    Parameters
+    ----------
+    config_path : str
+        Path to the config file.
+
+    Returns
+    -------
+    Path
+        The resolved parent directory of config_path.
+    """
+    # Key the cache on the absolute path, so a relative path still follows os.chdir()
+    return _resolve_parent_dir(os.path.abspath(config_path))
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_parent_dir(abs_path: str) -> Path:
+    """Resolve the parent directory of an absolute path (cached)."""
+    return Path(abs_path).parent.resolve()
+
+
+@functools.lru_cache(maxsize=32)
+def _read_query_file(path: str, mtime_ns: int, size: int) -> str:
+    """Read and strip a SQL file; mtime_ns and size are part of the cache key so edits are picked up."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().strip()
+
+
+def get_query_from_config(config: Mapping[str, Any], config_path: str = "config.yaml") -> str:
     """
     Get SQL query from configuration file.
     Supports both inline 'query' and 'query_file' options.
 
     Parameters
     ----------
-    config : Dict[str, Any]
+    config : Mapping[str, Any]
         Configuration dictionary.
     config_path : str
         Path to the config file (used for resolving relative paths in query_file).
@@ -114,14 +387,14 @@ def get_query_from_config(config: Dict[str, Any], config_path: str = "config.yam
     # Priority: query_file > query
     if query_file:
         # Resolve path relative to config file location
-        config_dir = Path(config_path).parent
-        query_file_path = (config_dir / query_file).resolve()
+        query_file_path = Path(os.path.normpath(resolve_config_dir(config_path) / query_file))
         
-        if not query_file_path.exists():
-            raise FileNotFoundError(f"Query file not found: {query_file_path}")
+        try:
+            st = query_file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Query file not found: {query_file_path}") from None
         
-        with query_file_path.open("r", encoding="utf-8") as f:
-            query_text = f.read().strip()
+        query_text = _read_query_file(str(query_file_path), st.st_mtime_ns, st.st_size)
         
         if not query_text:
             raise ValueError(f"Query file is empty: {query_file_path}")
@@ -142,41 +415,182 @@ def get_query_from_config(config: Dict[str, Any], config_path: str = "config.yam
     )
 
 
-def configure_ssl_settings(config: Dict[str, Any]) -> None:
+@functools.lru_cache(maxsize=32)
+def _existing_file(path: str) -> str:
+    """
+    Return path if it points to an existing file, raising FileNotFoundError otherwise.
+
+    Successful checks are remembered for the process lifetime, so repeated
+    connects with the same truststore or driver JAR don't stat the file again.
+    Failures are not cached.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    return path
+
+
+def _ensure_jvm(driver_jar: Optional[str] = None) -> bool:
+    """
+    Start the process-wide JVM once, with the Hive driver JAR on its classpath.
+
+    JayDeBeApi only honours its ``jars`` argument when it starts the JVM
+    itself, so starting it here with the JAR up front lets every later
+    connect reuse the running JVM and its already loaded driver classes.
+
+    Parameters
+    ----------
+    driver_jar : Optional[str]
+        Path to the Hive JDBC driver JAR, if any.
+
+    Returns
+    -------
+    bool
+        True if driver_jar is on the running JVM's classpath.
+    """
+    with _JVM_LOCK:
+        if not jpype.isJVMStarted():
+            classpath = [driver_jar] if driver_jar else []
+            # Keep honouring CLASSPATH, as JayDeBeApi does when it starts the JVM
+            classpath.extend(p for p in os.environ.get("CLASSPATH", "").split(os.pathsep) if p)
+            logger.info("Starting JVM")
+            jpype.startJVM(
+                jpype.getDefaultJVMPath(),
+                *_JVM_OPTIONS,
+                classpath=classpath,
+                ignoreUnrecognized=True,
+                convertStrings=True,
+            )
+            _JVM_CLASSPATH.extend(classpath)
+
+    if driver_jar and driver_jar not in _JVM_CLASSPATH:
+        logger.warning(
+            "JVM was already started without '%s' on its classpath; the driver may fail to load", driver_jar
+        )
+        return False
+    return True
+
+
+def warm_up_jvm(config: Mapping[str, Any]) -> None:
+    """
+    Start the JVM and load the Hive JDBC driver class ahead of the first connect.
+
+    Lets callers overlap the one-time JVM startup and driver class loading with
+    other work, for example in a background thread; such a thread is detached
+    from the JVM again before returning, so it can't hold up JVM shutdown.
+    Does nothing if Java or JPype is unavailable; get_hive_connection reports
+    those errors.
+
+    Parameters
+    ----------
+    config : Mapping[str, Any]
+        Configuration dictionary with hive_driver_class and optionally hive_driver_jar.
+    """
+    if jpype is None or not check_java_available():
+        return
+    driver_jar = config.get("hive_driver_jar")
+    if driver_jar and not os.path.exists(driver_jar):
+        return
+    try:
+        _ensure_jvm(driver_jar)
+        jpype.JClass(config["hive_driver_class"])
+        logger.info("JVM warmed up with driver class %s", config["hive_driver_class"])
+    except Exception:  # noqa: BLE001
+        logger.debug("JVM warm-up failed; the connection attempt will report the error", exc_info=True)
+    finally:
+        if threading.current_thread() is not threading.main_thread() and jpype.isJVMStarted():
+            # Attached threads are non-daemon Java threads and keep the JVM from shutting down
+            try:
+                jpype.java.lang.Thread.detach()
+            except Exception:  # noqa: BLE001
+                logger.debug("Could not detach warm-up thread from the JVM", exc_info=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _java_system():
+    """Return the java.lang.System class, resolved once per process (JVM must be running)."""
+    return jpype.JClass("java.lang.System")
+
+
+def ssl_settings_key(config: Mapping[str, Any]) -> Optional[Tuple[Any, ...]]:
+    """
+    Return the SSL settings get_hive_connection applies to the JVM for config.
+
+    The javax.net.ssl.* system properties are global to the JVM, so configs
+    with different keys can't safely connect concurrently in one process.
+
+    Parameters
+    ----------
+    config : Mapping[str, Any]
+        Configuration dictionary that may contain SSL settings.
+
+    Returns
+    -------
+    Optional[Tuple[Any, ...]]
+        A hashable tuple of the SSL settings, or None if the config sets none.
+    """
+    if not (config.get("truststore_path") or config.get("disable_ssl_verification")):
+        return None
+    return _ssl_key(config)
+
+
+def _ssl_key(config: Mapping[str, Any]) -> Tuple[Any, ...]:
+    """Return the SSL settings in config as a tuple, with configure_ssl_settings' defaults filled in."""
+    return (
+        config.get("truststore_path"),
+        config.get("truststore_password", ""),
+        config.get("truststore_type", "JKS"),
+        config.get("disable_ssl_verification", False),
+        config.get("keystore_path"),
+        config.get("keystore_password"),
+        config.get("keystore_type"),
+    )
+
+
+def configure_ssl_settings(config: Mapping[str, Any]) -> None:
     """
     Configure SSL/TLS settings for Java/JDBC connections.
     Sets Java system properties for truststore and SSL verification.
+    Does nothing if the same settings were already applied in this process.
+    Calls are serialized, but the properties are JVM-wide; see ssl_settings_key.
 
     Parameters
     ----------
-    config : Dict[str, Any]
+    config : Mapping[str, Any]
         Configuration dictionary that may contain SSL settings.
     """
     if jpype is None:
         logger.warning("jpype not available - SSL settings will be ignored. Install JPype1 for SSL support.")
         return
 
-    # Check if SSL configuration is provided
-    truststore_path = config.get("truststore_path")
-    truststore_password = config.get("truststore_password", "")
-    truststore_type = config.get("truststore_type", "JKS")
-    disable_ssl_verification = config.get("disable_ssl_verification", False)
+    ssl_key = _ssl_key(config)
+    with _SSL_LOCK:
+        _apply_ssl_settings(config, ssl_key)
+
+
+def _apply_ssl_settings(config: Mapping[str, Any], ssl_key: Tuple[Any, ...]) -> None:
+    """Set the javax.net.ssl.* system properties unless ssl_key is already applied (caller holds _SSL_LOCK)."""
+    global _LAST_SSL_KEY
+    if ssl_key == _LAST_SSL_KEY:
+        return
+    truststore_path, truststore_password, truststore_type, disable_ssl_verification = ssl_key[:4]
 
     # Ensure JVM is started
-    if not jpype.isJVMStarted():
-        jpype.startJVM(jpype.getDefaultJVMPath())
+    _ensure_jvm(config.get("hive_driver_jar"))
+    system = _java_system()
 
     if disable_ssl_verification:
         logger.warning("SSL certificate verification is DISABLED. This is not recommended for production!")
         # Note: Completely disabling SSL verification requires custom TrustManager
         # For now, we'll set empty truststore which may help in some cases
-        jpype.java.lang.System.setProperty("javax.net.ssl.trustStore", "")
-        jpype.java.lang.System.setProperty("javax.net.ssl.trustStorePassword", "")
+        system.setProperty("javax.net.ssl.trustStore", "")
+        system.setProperty("javax.net.ssl.trustStorePassword", "")
 
     if truststore_path:
         truststore_path_obj = Path(truststore_path)
-        if not truststore_path_obj.exists():
-            raise FileNotFoundError(f"Truststore file not found: {truststore_path}")
+        try:
+            _existing_file(truststore_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Truststore file not found: {truststore_path}") from None
         
         if not truststore_path_obj.is_absolute():
             raise ValueError(f"Truststore path must be absolute: {truststore_path}")
@@ -184,27 +598,29 @@ def configure_ssl_settings(config: Dict[str, Any]) -> None:
         logger.info("Configuring SSL truststore: %s (type: %s)", truststore_path, truststore_type)
         
         # Set Java system properties for SSL
-        jpype.java.lang.System.setProperty("javax.net.ssl.trustStore", str(truststore_path_obj))
-        jpype.java.lang.System.setProperty("javax.net.ssl.trustStorePassword", truststore_password)
-        jpype.java.lang.System.setProperty("javax.net.ssl.trustStoreType", truststore_type)
+        system.setProperty("javax.net.ssl.trustStore", str(truststore_path_obj))
+        system.setProperty("javax.net.ssl.trustStorePassword", truststore_password)
+        system.setProperty("javax.net.ssl.trustStoreType", truststore_type)
         
         # Additional SSL properties (may be needed for client certificates)
         if config.get("keystore_path"):
             keystore_path_obj = Path(config["keystore_path"])
             keystore_password = config.get("keystore_password", truststore_password)
             keystore_type = config.get("keystore_type", truststore_type)
-            jpype.java.lang.System.setProperty("javax.net.ssl.keyStore", str(keystore_path_obj))
-            jpype.java.lang.System.setProperty("javax.net.ssl.keyStorePassword", keystore_password)
-            jpype.java.lang.System.setProperty("javax.net.ssl.keyStoreType", keystore_type)
+            system.setProperty("javax.net.ssl.keyStore", str(keystore_path_obj))
+            system.setProperty("javax.net.ssl.keyStorePassword", keystore_password)
+            system.setProperty("javax.net.ssl.keyStoreType", keystore_type)
+
+    _LAST_SSL_KEY = ssl_key
 
 
-def get_hive_connection(config: Dict[str, Any]):
+def get_hive_connection(config: Mapping[str, Any]):
     """
     Create and return a Hive connection using JDBC.
 
     Parameters
     ----------
-    config : Dict[str, Any]
+    config : Mapping[str, Any]
         Configuration dictionary with keys: hive_jdbc_url, hive_driver_class,
         username, password. May also contain SSL settings.
 
@@ -216,19 +632,11 @@ def get_hive_connection(config: Dict[str, Any]):
     # Check if Java is available before attempting connection
     if not check_java_available():
         raise RuntimeError(
-            "Java is not installed or not in PATH. "
-            "Please install Java (JDK 8 or later) and ensure it's in your system PATH. "
+            "Java is not installed or could not be located. "
+            "Please install Java (JDK 8 or later) and set JAVA_HOME or add it to your system PATH. "
             "You can verify by running: java -version"
         )
 
-    # Configure SSL settings if provided (must be done before connecting)
-    if config.get("truststore_path") or config.get("disable_ssl_verification"):
-        # Ensure JPype is started
-        if not jpype.isJVMStarted():
-            # Start JVM if not already started
-            jpype.startJVM(jpype.getDefaultJVMPath())
-        configure_ssl_settings(config)
-
     jdbc_url = config["hive_jdbc_url"]
     driver_class = config["hive_driver_class"]
     username = config["username"]
@@ -238,9 +646,20 @@ def get_hive_connection(config: Dict[str, Any]):
 
     try:
         if driver_jar:
-            # If JAR path is provided, use it
-            if not os.path.exists(driver_jar):
-                raise FileNotFoundError(f"Hive JDBC driver JAR not found at: {driver_jar}")
+            try:
+                _existing_file(driver_jar)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Hive JDBC driver JAR not found at: {driver_jar}") from None
+
+        # Start the JVM with the driver JAR on its classpath before anything else touches it
+        jar_on_classpath = _ensure_jvm(driver_jar) if jpype is not None else False
+
+        # Configure SSL settings if provided (must be done before connecting)
+        if ssl_settings_key(config) is not None:
+            configure_ssl_settings(config)
+
+        if driver_jar and not jar_on_classpath:
+            # JVM not managed by us; let JayDeBeApi handle the JAR
             conn = jaydebeapi.connect(
                 driver_class,
                 jdbc_url,
@@ -248,7 +667,7 @@ def get_hive_connection(config: Dict[str, Any]):
                 driver_jar,
             )
         else:
-            # Try to connect without explicit JAR (assumes it's in classpath)
+            # Driver JAR (if any) is already on the JVM classpath
             conn = jaydebeapi.connect(
                 driver_class,
                 jdbc_url,
@@ -283,41 +702,622 @@ def get_hive_connection(config: Dict[str, Any]):
     return conn
 
 
-def run_hive_query(query: str, config: Dict[str, Any]) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+def _close_quietly(conn) -> None:
+    """Close a connection, ignoring errors from already-broken connections."""
+    try:
+        conn.close()
+    except Exception:  # noqa: BLE001
+        logger.debug("Ignoring error while closing Hive connection", exc_info=True)
+
+
+# Config keys that determine how a connection is opened; tags that agree on all of them share pooled connections
+_CONNECTION_KEYS = (
+    "hive_jdbc_url",
+    "hive_driver_class",
+    "hive_driver_jar",
+    "username",
+    "password",
+    "truststore_path",
+    "truststore_password",
+    "truststore_type",
+    "keystore_path",
+    "keystore_password",
+    "keystore_type",
+    "disable_ssl_verification",
+)
+
+
+class HiveConnectionPool:
     """
-    Run a query against Hive and return the results.
+    Process-local pool of idle Hive JDBC connections.
+
+    Connections are grouped by every connection setting in the config (URL,
+    driver, credentials and SSL options), so a connection is only ever reused
+    for a config that would have opened an identical one. Query settings such
+    as ``query`` or ``output`` don't split the pool. Each group keeps at most
+    ``pool_size`` idle connections (config key, default 5).
+    """
+
+    def __init__(self) -> None:
+        self._idle: Dict[Tuple[Any, ...], queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(config: Mapping[str, Any]) -> Tuple[Any, ...]:
+        return tuple(config.get(name) for name in _CONNECTION_KEYS)
+
+    def _idle_queue(self, config: Mapping[str, Any]) -> queue.LifoQueue:
+        key = self._key(config)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle is None:
+                idle = queue.LifoQueue(maxsize=int(config.get("pool_size", 5)))
+                self._idle[key] = idle
+            return idle
+
+    @staticmethod
+    def _is_valid(conn) -> bool:
+        try:
+            return bool(conn.jconn.isValid(1))
+        except Exception:  # noqa: BLE001
+            # Older Hive drivers don't implement isValid(); fall back to a trivial query
+            pass
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception:  # noqa: BLE001
+            return False
+
+    @contextmanager
+    def acquire(self, config: Mapping[str, Any]) -> Iterator[Any]:
+        """
+        Check out a connection for the given config, creating one if none is idle.
+
+        The connection is returned to the pool when the block exits normally, or
+        with GeneratorExit (a streaming caller closing its generator early), and
+        closed if the block raises anything else, since its state is then unknown.
+
+        Parameters
+        ----------
+        config : Mapping[str, Any]
+            Configuration dictionary with connection settings.
+
+        Yields
+        ------
+        jaydebeapi.Connection
+            A validated JDBC connection.
+        """
+        idle = self._idle_queue(config)
+        conn = None
+        while conn is None:
+            try:
+                candidate = idle.get_nowait()
+            except queue.Empty:
+                conn = get_hive_connection(config)
+                break
+            if self._is_valid(candidate):
+                logger.debug("Reusing pooled Hive connection")
+                conn = candidate
+            else:
+                _close_quietly(candidate)
+
+        try:
+            yield conn
+        except GeneratorExit:
+            # A generator holding the connection was closed early; its cursor is already closed
+            self.release(conn, config)
+            raise
+        except BaseException:
+            _close_quietly(conn)
+            raise
+        self.release(conn, config)
+
+    def release(self, conn, config: Mapping[str, Any]) -> None:
+        """
+        Return a connection to the pool, closing it if the pool is already full.
+
+        Parameters
+        ----------
+        conn : jaydebeapi.Connection
+            Connection previously obtained from :meth:`acquire`.
+        config : Mapping[str, Any]
+            The configuration the connection was acquired with.
+        """
+        try:
+            self._idle_queue(config).put_nowait(conn)
+        except queue.Full:
+            _close_quietly(conn)
+
+    def close_all(self) -> None:
+        """Close every idle connection held by the pool."""
+        with self._lock:
+            idle_queues = list(self._idle.values())
+            self._idle.clear()
+        for idle in idle_queues:
+            while True:
+                try:
+                    _close_quietly(idle.get_nowait())
+                except queue.Empty:
+                    break
+
+
+_POOL = HiveConnectionPool()
+atexit.register(_POOL.close_all)
+
+
+def _apply_fetch_size(cursor, config: Mapping[str, Any]) -> int:
+    """
+    Set the DB-API and JDBC fetch sizes on an executed cursor.
 
     Parameters
     ----------
-    query : str
-        The SQL query to execute.
-    config : Dict[str, Any]
-        Configuration dictionary with connection settings.
+    cursor : jaydebeapi.Cursor
+        Cursor that has already executed a query.
+    config : Mapping[str, Any]
+        Configuration dictionary; ``fetch_size`` overrides the default batch size.
 
     Returns
     -------
-    Tuple[List[str], List[Tuple[Any, ...]]]
-        A tuple of (column_names, rows).
+    int
+        The fetch size that was applied.
+    """
+    fetch_size = int(config.get("fetch_size", DEFAULT_FETCH_SIZE))
+    cursor.arraysize = fetch_size
+    # Ask the JDBC driver to pull rows from HiveServer2 in blocks of the same size
+    result_set = getattr(cursor, "_rs", None)
+    if result_set is not None:
+        try:
+            result_set.setFetchSize(fetch_size)
+        except Exception:  # noqa: BLE001
+            logger.debug("JDBC driver rejected setFetchSize(%d)", fetch_size, exc_info=True)
+    return fetch_size
+
+
+def _fetch_string_rows(result_set, column_count: int, size: int) -> List[Tuple[Optional[str], ...]]:
+    """
+    Fetch up to size rows straight from a JDBC ResultSet as strings.
+
+    Calls ``ResultSet.getString`` per cell instead of going through
+    jaydebeapi's type-dispatching converters. SQL NULLs come back as None.
+    """
+    # Hoist the Java method lookups out of the per-cell loop
+    next_row = result_set.next
+    get_string = result_set.getString
+    indexes = range(1, column_count + 1)
+    rows = []
+    append = rows.append
+    while len(rows) < size and next_row():
+        append(tuple([get_string(i) for i in indexes]))
+    return rows
+
+
+def _iter_query_batches(
+    query: str,
+    config: Mapping[str, Any],
+    as_strings: bool = False,
+) -> Iterator[Tuple[List[Tuple[Any, ...]], List[Tuple[Any, ...]]]]:
+    """
+    Execute a query on a pooled connection and yield (cursor.description, rows) per batch.
+
+    Each description entry has the column's java.sql.Types constant appended
+    (see _with_jdbc_types). A query that returns no rows yields a single (description, []) pair. With
+    as_strings, every value is read with JDBC ``getString`` (None for NULL).
     """
     logger.info("Running Hive query")
 
-    conn = None
     try:
-        conn = get_hive_connection(config)
-        cursor = conn.cursor()
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        # Get column names from cursor description
-        columns = [col[0] for col in cursor.description] if cursor.description else []
-        cursor.close()
+        with _POOL.acquire(config) as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query)
+                fetch_size = _apply_fetch_size(cursor, config)
+                description = _with_jdbc_types(cursor, cursor.description or [])
+                result_set = getattr(cursor, "_rs", None) if as_strings else None
+                total = 0
+                while True:
+                    if result_set is not None:
+                        batch = _fetch_string_rows(result_set, len(description), fetch_size)
+                    else:
+                        batch = cursor.fetchmany(fetch_size)
+                    if not batch:
+                        break
+                    total += len(batch)
+                    yield description, batch
+                    if result_set is not None and len(batch) < fetch_size:
+                        # Short batch: the ResultSet is exhausted, skip the extra round trip
+                        break
+                if total == 0:
+                    yield description, []
+            finally:
+                cursor.close()
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Failed to execute query against Hive")
+        raise
+
+    logger.info("Query succeeded, retrieved %d rows", total)
+
+
+def stream_hive_query(
+    query: str,
+    config: Mapping[str, Any],
+    batch_size: Optional[int] = None,
+) -> Iterator[Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]]:
+    """
+    Run a query against Hive and yield the results batch by batch.
+
+    The connection is held until the generator is exhausted or closed, so
+    callers can process (or write out) rows while later batches are fetched.
+
+    Parameters
+    ----------
+    query : str
+        The SQL query to execute.
+    config : Mapping[str, Any]
+        Configuration dictionary with connection settings.
+    batch_size : Optional[int]
+        Rows per batch. Defaults to the config's ``fetch_size``.
+
+    Yields
+    ------
+    Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]
+        A tuple of (column_names, rows) per batch. A query that returns no rows
+        yields a single (column_names, []) pair.
+    """
+    if batch_size is not None:
+        config = {**config, "fetch_size": batch_size}
+
+    columns: Optional[Tuple[str, ...]] = None
+    as_strings = bool(config.get("fetch_as_strings", False))
+    for description, batch in _iter_query_batches(query, config, as_strings=as_strings):
+        if columns is None:
+            # Get column names from cursor description, interned since they repeat across queries and lookups
+            columns = tuple([sys.intern(str(col[0])) for col in description])
+        yield columns, batch
+
+
+# java.sql.Types constants with a fixed Arrow type (BIT, BOOLEAN, TINYINT, SMALLINT, INTEGER, BIGINT, REAL, FLOAT, DOUBLE)
+_JDBC_ARROW_TYPES = {
+    -7: "bool_",
+    16: "bool_",
+    -6: "int8",
+    5: "int16",
+    4: "int32",
+    -5: "int64",
+    7: "float32",
+    6: "float64",
+    8: "float64",
+}
+
+
+def _with_jdbc_types(cursor, description: List[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+    """
+    Append each column's java.sql.Types constant to its cursor.description entry.
+
+    jaydebeapi's type codes only name the DB-API group (NUMBER covers BOOLEAN
+    and every integer width), so the exact JDBC type is read from the result
+    set metadata. Entries get None when the metadata is unavailable.
+    """
+    meta = getattr(cursor, "_meta", None)
+    jdbc_types: List[Optional[int]] = [None] * len(description)
+    if meta is not None:
+        try:
+            jdbc_types = [int(meta.getColumnType(i)) for i in range(1, len(description) + 1)]
+        except Exception:  # noqa: BLE001
+            logger.debug("Could not read JDBC column types", exc_info=True)
+    # Pad to the 7 DB-API fields so the JDBC type is always at index 7
+    return [tuple(col) + (None,) * (7 - len(col)) + (jdbc_type,) for col, jdbc_type in zip(description, jdbc_types)]
+
+
+def _arrow_type(column: Tuple[Any, ...]) -> Optional["pyarrow.DataType"]:
+    """Map a cursor description entry (see _with_jdbc_types) to an Arrow type, or None to let Arrow infer it."""
+    jdbc_type = column[7] if len(column) > 7 else None
+    if jdbc_type in _JDBC_ARROW_TYPES:
+        return getattr(pyarrow, _JDBC_ARROW_TYPES[jdbc_type])()
+    type_code = column[1]
+    if type_code is jaydebeapi.FLOAT or type_code is jaydebeapi.DECIMAL:
+        return pyarrow.float64()
+    if type_code in (jaydebeapi.STRING, jaydebeapi.TEXT, jaydebeapi.DATE, jaydebeapi.TIME, jaydebeapi.DATETIME):
+        return pyarrow.string()
+    # NUMBER mixes booleans and integers, and BINARY may be bytes or str; let Arrow infer
+    return None
+
+
+def _untyped_column_type(column: Tuple[Any, ...]) -> "pyarrow.DataType":
+    """Arrow type for a column whose first batch held only NULLs, so Arrow couldn't infer one."""
+    return pyarrow.int64() if column[1] is jaydebeapi.NUMBER else pyarrow.string()
+
+
+def stream_hive_query_arrow(query: str, config: Mapping[str, Any]) -> Iterator["pyarrow.RecordBatch"]:
+    """
+    Run a query against Hive and yield the results as Arrow RecordBatches, one per fetched batch.
+
+    The schema is fixed by the first batch, so every yielded batch has the same
+    schema and can be fed straight into a pyarrow writer. With ``protocol: thrift``
+    in the config, batches come from impyla's columnar fetch over HiveServer2
+    Thrift instead of JDBC.
+
+    Parameters
+    ----------
+    query : str
+        The SQL query to execute.
+    config : Mapping[str, Any]
+        Configuration dictionary with connection settings.
+
+    Yields
+    ------
+    pyarrow.RecordBatch
+        Query results, one typed Arrow array per column. A query that returns
+        no rows yields a single empty batch.
+    """
+    if pyarrow is None:
+        raise ImportError("pyarrow is not installed. Please install it with: pip install pyarrow")
+
+    if config.get("protocol") == "thrift":
+        yield from _stream_thrift_query_arrow(query, config)
+        return
+
+    schema = None
+    for description, batch in _iter_query_batches(query, config):
+        columns = list(zip(*batch)) if batch else [()] * len(description)
+        if schema is None:
+            arrays = [pyarrow.array(values, type=_arrow_type(col)) for col, values in zip(description, columns)]
+            # Columns with no values yet can't be inferred; fall back to their DB-API group
+            arrays = [
+                a.cast(_untyped_column_type(col)) if pyarrow.types.is_null(a.type) else a
+                for col, a in zip(description, arrays)
+            ]
+            schema = pyarrow.schema(
+                [(col[0], array.type) for col, array in zip(description, arrays)]
+            )
+        else:
+            arrays = [_to_arrow_array(values, field.type) for values, field in zip(columns, schema)]
+        yield pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _to_arrow_array(values: Tuple[Any, ...], arrow_type: "pyarrow.DataType") -> "pyarrow.Array":
+    """Convert a column chunk to arrow_type, stringifying values if the column was typed as string up front."""
+    try:
+        return pyarrow.array(values, type=arrow_type)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        if not pyarrow.types.is_string(arrow_type):
+            raise
+        return pyarrow.array([None if v is None else str(v) for v in values], type=arrow_type)
+
+
+# HiveServer2 primitive type names with a fixed Arrow type; everything else arrives as strings
+_THRIFT_ARROW_TYPES = {
+    "BOOLEAN": "bool_",
+    "TINYINT": "int8",
+    "SMALLINT": "int16",
+    "INT": "int32",
+    "BIGINT": "int64",
+    "FLOAT": "float32",
+    "DOUBLE": "float64",
+}
+
+
+# Truststore file extensions impyla can use directly as a CA certificate bundle
+_PEM_SUFFIXES = frozenset({".pem", ".crt", ".cer"})
+
+
+def _parse_hive_jdbc_url(jdbc_url: str) -> Tuple[str, Optional[str], Dict[str, str]]:
+    """
+    Split a jdbc:hive2:// URL into its host list, database and session settings.
+
+    ``jdbc:hive2://host:port/db;ssl=true`` gives ``("host:port", "db", {"ssl": "true"})``.
+    Setting names are lower-cased, as the Hive JDBC driver treats them case-insensitively.
+    """
+    url = urlsplit(jdbc_url.split(":", 1)[-1])
+    database, *session = url.path.lstrip("/").split(";")
+    settings = {}
+    for item in session:
+        name, sep, value = item.partition("=")
+        if sep:
+            settings[name.strip().lower()] = value.strip()
+    return url.netloc, database or None, settings
+
+
+def _get_thrift_connection(config: Mapping[str, Any]):
+    """
+    Open a HiveServer2 Thrift connection with impyla.
+
+    Host, port and database come from the ``host``, ``port`` and ``database``
+    config keys, falling back to the parts of ``hive_jdbc_url``. TLS is enabled
+    by ``use_ssl`` or ``ssl=true`` in the URL and verified against ``ca_cert``,
+    or a PEM ``truststore_path`` / ``sslTrustStore``.
+    """
+    if impala_connect is None:
+        raise ImportError("impyla is not installed. Please install it with: pip install impyla")
+
+    hosts, database, settings = _parse_hive_jdbc_url(config["hive_jdbc_url"])
+    if "," in hosts or settings.get("servicediscoverymode", "").lower() == "zookeeper":
+        # The URL lists ZooKeeper nodes, not a HiveServer2 instance
+        if "host" not in config:
+            raise ValueError(
+                "protocol: thrift does not support ZooKeeper service discovery URLs; "
+                "set 'host' and 'port' of a HiveServer2 instance in the config"
+            )
+        url_host, url_port = None, None
+    else:
+        url = urlsplit(f"//{hosts}")
+        url_host, url_port = url.hostname, url.port
+
+    use_ssl = bool(config.get("use_ssl", settings.get("ssl", "").lower() == "true"))
+    ca_cert = config.get("ca_cert")
+    if use_ssl and ca_cert is None and not config.get("disable_ssl_verification"):
+        truststore = config.get("truststore_path") or settings.get("ssltruststore")
+        if not truststore or Path(truststore).suffix.lower() not in _PEM_SUFFIXES:
+            raise ValueError(
+                "TLS is enabled but protocol: thrift has no PEM CA certificate to verify the server with; "
+                "set 'ca_cert' to a PEM file (impyla can't read Java JKS/PKCS12 truststores)"
+            )
+        ca_cert = truststore
+
+    return impala_connect(
+        host=config.get("host", url_host),
+        port=int(config.get("port", url_port or 10000)),
+        database=config.get("database", database),
+        user=config["username"],
+        password=config["password"],
+        auth_mechanism=config.get("auth_mechanism", "PLAIN"),
+        use_ssl=use_ssl,
+        ca_cert=ca_cert,
+    )
+
+
+def _iter_columnar_batches(cursor) -> Iterator[Any]:
+    """
+    Yield impyla's columnar result batches one HiveServer2 fetch at a time.
+
+    ``cursor.fetchcolumnar()`` collects every batch before returning, so this
+    runs the same fetch loop incrementally. Falls back to fetchcolumnar() on
+    impyla versions without the operation object it relies on.
+    """
+    operation = getattr(cursor, "_last_operation", None)
+    if operation is None or not hasattr(cursor, "_wait_to_finish"):
+        yield from cursor.fetchcolumnar()
+        return
+    cursor._wait_to_finish()
+    if not operation.is_columnar:
+        # Let impyla raise its NotSupportedError
+        yield from cursor.fetchcolumnar()
+        return
+    options = {"convert_types": cursor.convert_types}
+    if hasattr(cursor, "convert_strings_to_unicode"):
+        options["convert_strings_to_unicode"] = cursor.convert_strings_to_unicode
+    while True:
+        batch = operation.fetch(cursor.description, cursor.buffersize, **options)
+        if len(batch) == 0:
+            if getattr(batch, "expect_more_rows", False):
+                continue
+            return
+        yield batch
+
+
+def _stream_thrift_query_arrow(query: str, config: Mapping[str, Any]) -> Iterator["pyarrow.RecordBatch"]:
+    """Run a query over HiveServer2 Thrift and yield one Arrow RecordBatch per columnar fetch."""
+    logger.info("Running Hive query over Thrift")
+
+    conn = _get_thrift_connection(config)
+    try:
+        # Keep DECIMAL/TIMESTAMP/DATE as strings, matching the JDBC path
+        cursor = conn.cursor(convert_types=False)
+        try:
+            cursor.execute(query)
+            # Rows per HiveServer2 fetch round trip
+            cursor.arraysize = int(config.get("fetch_size", DEFAULT_FETCH_SIZE))
+            description = cursor.description or []
+            schema = pyarrow.schema(
+                [(col[0], getattr(pyarrow, _THRIFT_ARROW_TYPES.get(col[1], "string"))()) for col in description]
+            )
+            num_rows = 0
+            for batch in _iter_columnar_batches(cursor):
+                arrays = []
+                for field, column in zip(schema, batch.columns):
+                    n = len(column.values)
+                    # impyla's null bitmap is little-endian, the same bit order Arrow uses
+                    mask = pyarrow.BooleanArray.from_buffers(
+                        pyarrow.bool_(), n, [None, pyarrow.py_buffer(column.nulls.tobytes())]
+                    )
+                    arrays.append(pyarrow.array(column.values, type=field.type, mask=mask))
+                record_batch = pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+                num_rows += record_batch.num_rows
+                yield record_batch
+            if num_rows == 0:
+                yield pyarrow.RecordBatch.from_arrays([pyarrow.array([], type=field.type) for field in schema], schema=schema)
+        finally:
+            cursor.close()
     except Exception as exc:  # noqa: BLE001
         logger.exception("Failed to execute query against Hive")
         raise
     finally:
-        if conn:
-            conn.close()
+        conn.close()
+
+    logger.info("Query succeeded, retrieved %d rows", num_rows)
+
+
+def run_hive_query_arrow(query: str, config: Mapping[str, Any]) -> "pyarrow.RecordBatch":
+    """
+    Run a query against Hive and return the results as a columnar Arrow RecordBatch.
+
+    Rows are transposed into per-column lists batch by batch, so no list of
+    row tuples for the full result set is ever built. With ``protocol: thrift``
+    in the config, the query bypasses JDBC and uses impyla's columnar fetch
+    over HiveServer2 Thrift, so rows are never materialized at all.
+
+    Parameters
+    ----------
+    query : str
+        The SQL query to execute.
+    config : Mapping[str, Any]
+        Configuration dictionary with connection settings.
+
+    Returns
+    -------
+    pyarrow.RecordBatch
+        The query results, one typed Arrow array per column.
+    """
+    if pyarrow is None:
+        raise ImportError("pyarrow is not installed. Please install it with: pip install pyarrow")
+
+    if config.get("protocol") == "thrift":
+        record_batches = list(_stream_thrift_query_arrow(query, config))
+        arrays = [
+            pyarrow.concat_arrays([record_batch.column(i) for record_batch in record_batches])
+            for i in range(record_batches[0].num_columns)
+        ]
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=record_batches[0].schema)
+
+    description: List[Tuple[Any, ...]] = []
+    column_values: List[List[Any]] = []
+    for description, batch in _iter_query_batches(query, config):
+        if not column_values:
+            column_values = [[] for _ in description]
+        for values, column in zip(column_values, zip(*batch)):
+            values.extend(column)
+
+    arrays = [
+        pyarrow.array(values, type=_arrow_type(col))
+        for col, values in zip(description, column_values)
+    ]
+    return pyarrow.RecordBatch.from_arrays(arrays, names=list(map(itemgetter(0), description)))
+
+
+def run_hive_query(
+    query: str,
+    config: Optional[Mapping[str, Any]] = None,
+    config_path: str = "config.yaml",
+) -> Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]:
+    """
+    Run a query against Hive and return the results.
+
+    Parameters
+    ----------
+    query : str
+        The SQL query to execute.
+    config : Optional[Mapping[str, Any]]
+        Configuration dictionary with connection settings. Pass the config you
+        already loaded to avoid reading the config file again.
+    config_path : str
+        Config file to load when config is not given (flat config structure).
+
+    Returns
+    -------
+    Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]
+        A tuple of (column_names, rows).
+    """
+    if config is None:
+        config = load_config(config_path)
 
-    logger.info("Query succeeded, retrieved %d rows", len(rows))
+    columns: Tuple[str, ...] = ()
+    rows: List[Tuple[Any, ...]] = []
+    for columns, batch in stream_hive_query(query, config):
+        rows.extend(batch)
     return columns, rows
 
 
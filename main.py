@@ -1,10 +1,41 @@
 import argparse
 import csv
+import gzip
+import io
+import itertools
 import logging
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Iterable, Iterator, List, Mapping, Optional, Sequence, TextIO, Tuple
 
-from hive_connector import load_config, get_query_from_config, run_hive_query
+from hive_connector import (
+    get_query_from_config,
+    load_config,
+    resolve_config_dir,
+    ssl_settings_key,
+    stream_hive_query,
+    stream_hive_query_arrow,
+    warm_up_jvm,
+)
+
+try:
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa_csv = None  # optional, only needed for protocol: thrift or csv_writer: pyarrow
+
+# Rows pyarrow converts to CSV text per chunk
+ARROW_CSV_BATCH_SIZE = 65536
+# Output file buffer size; far fewer write() syscalls than the default 8 KiB on large exports
+CSV_BUFFER_SIZE = 1 << 20
+# --output value that streams the CSV to stdout instead of a file
+STDOUT_OUTPUT = "-"
 
 
 def parse_args() -> argparse.Namespace:
@@ -23,6 +54,12 @@ Examples:
 
   # Using different config file
   python3 main.py --config my_config.yaml --tag InputQuery1
+
+  # Run several tagged queries concurrently (one CSV per tag)
+  python3 main.py --tag InputQuery1 InputQuery2
+
+  # Stream the CSV to stdout, e.g. into a compressor
+  python3 main.py --tag InputQuery1 --output - | gzip > results.csv.gz
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -36,26 +73,27 @@ Examples:
         "--tag",
         "-t",
         type=str,
+        nargs="+",
         default=None,
-        help="Tag name of the configuration to use (e.g., InputQuery1, InputQuery2). Required when config file uses tagged configurations. Each tag contains its own connection settings and query.",
+        help="Tag name(s) of the configuration to use (e.g., InputQuery1, InputQuery2). Required when config file uses tagged configurations. Each tag contains its own connection settings and query. Multiple tags run concurrently, each writing its own CSV.",
     )
     parser.add_argument(
         "--output",
         "-o",
         type=str,
         default=None,
-        help="Path to the output CSV file. If not provided, output name is derived from query_file in config (e.g., abc.sql -> abc.csv), or defaults to output.csv",
+        help="Path to the output CSV file. If not provided, output name is derived from query_file in config (e.g., abc.sql -> abc.csv), or defaults to output.csv. Use '-' to write the CSV to stdout",
     )
     return parser.parse_args()
 
 
-def determine_output_path(config: dict, config_path: str, explicit_output: Optional[str]) -> Path:
+def determine_output_path(config: Mapping[str, Any], config_path: str, explicit_output: Optional[str]) -> Path:
     """
     Determine the output CSV file path based on config and command line arguments.
 
     Parameters
     ----------
-    config : dict
+    config : Mapping[str, Any]
         Configuration dictionary.
     config_path : str
         Path to the config file.
@@ -76,56 +114,329 @@ def determine_output_path(config: dict, config_path: str, explicit_output: Optio
         output_path = Path(config["output"])
         # Resolve relative paths relative to config file location
         if not output_path.is_absolute():
-            config_dir = Path(config_path).parent
-            output_path = (config_dir / output_path).resolve()
+            output_path = Path(os.path.normpath(resolve_config_dir(config_path) / output_path))
         return output_path
 
     # Try to derive from query_file
     query_file = config.get("query_file")
     if query_file:
-        config_dir = Path(config_path).parent
-        query_file_path = (config_dir / query_file).resolve()
+        query_file_path = Path(os.path.normpath(resolve_config_dir(config_path) / query_file))
         return query_file_path.with_suffix(".csv")
 
     # Default fallback
     return Path("output.csv")
 
 
-def main() -> None:
-    logging.basicConfig(level=logging.INFO)
-    args = parse_args()
+def is_stdout(output_path: Path) -> bool:
+    """Return True if output_path is the stdout marker ('-')."""
+    return str(output_path) == STDOUT_OUTPUT
+
+
+class StdoutClosedError(BrokenPipeError):
+    """Raised when the reader of stdout closes the pipe while CSV output is written to it."""
+
+
+class _StdoutWriter(io.RawIOBase):
+    """Unbuffered writer for stdout's file descriptor that reports a closed pipe as StdoutClosedError."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._fd = sys.stdout.fileno()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        try:
+            return os.write(self._fd, data)
+        except BrokenPipeError as exc:
+            raise StdoutClosedError(*exc.args) from exc
+
+
+@contextmanager
+def _pigz_output(pigz: str, raw: BinaryIO, output_path: Path) -> Iterator[BinaryIO]:
+    """Yield a pipe into a pigz process that compresses into raw (the file for output_path), using every CPU."""
+    process = subprocess.Popen(
+        [pigz, "-p", str(os.cpu_count() or 1), "-c"],
+        stdin=subprocess.PIPE,
+        stdout=raw,
+        bufsize=CSV_BUFFER_SIZE,
+    )
     try:
-        # Load configuration for the specified tag
-        config = load_config(args.config, tag=args.tag)
-        
-        # Get query from config
-        query = get_query_from_config(config, args.config)
-        
-        # Determine output path
-        output_path = determine_output_path(config, args.config, args.output)
-
-        # Execute query
-        columns, rows = run_hive_query(query, config=config)
+        try:
+            yield process.stdin
+        finally:
+            process.stdin.close()
+    except BrokenPipeError as exc:
+        # pigz went away mid-export; report its exit status rather than the bare pipe error
+        raise OSError(f"pigz exited with status {process.wait()} while writing {output_path}") from exc
+    finally:
+        returncode = process.wait()
+    if returncode:
+        raise OSError(f"pigz exited with status {returncode} while writing {output_path}")
 
-    except Exception as exc:  # noqa: BLE001
-        logging.error("Failed to run query: %s", exc)
-        raise SystemExit(1) from exc
 
-    if not rows:
-        print("Query executed successfully. No rows returned.")
+@contextmanager
+def _replace_on_success(output_path: Path) -> Iterator[Path]:
+    """
+    Yield the path to write output_path's contents to.
+
+    For a missing or regular file (after following symlinks) this is a
+    temporary file next to the real target, which replaces it once the block
+    succeeds, keeping the existing file's mode; if the block raises, the
+    temporary file is removed and the target is left untouched, so a failed
+    export never leaves a truncated file behind. Anything else (a device such
+    as /dev/null, a FIFO, ...) is yielded as-is and written through directly.
+    """
+    target = Path(os.path.realpath(output_path))
+    try:
+        target_st = os.stat(target)
+    except FileNotFoundError:
+        target_st = None
+    if target_st is not None and not stat.S_ISREG(target_st.st_mode):
+        yield output_path
+        return
+
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        yield tmp_path
+        if target_st is not None:
+            os.chmod(tmp_path, stat.S_IMODE(target_st.st_mode))
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    os.replace(tmp_path, target)
+
+
+@contextmanager
+def open_binary_output(output_path: Path) -> Iterator[BinaryIO]:
+    """
+    Open a binary stream for output, creating parent directories as needed.
+
+    '-' yields a buffered writer on stdout, which is flushed but left open on exit. Paths
+    ending in '.gz' are gzip-compressed, through a multi-threaded pigz process
+    when pigz is on PATH and with the stdlib gzip module otherwise. Regular files
+    are written to a temporary name and only moved into place if the block succeeds.
+    """
+    if is_stdout(output_path):
+        sys.stdout.flush()
+        stream = io.BufferedWriter(_StdoutWriter(), CSV_BUFFER_SIZE)
+        yield stream
+        stream.flush()
         return
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    with _replace_on_success(output_path) as tmp_path:
+        if output_path.suffix == ".gz":
+            pigz = shutil.which("pigz")
+            with tmp_path.open("wb") as raw:
+                if pigz:
+                    with _pigz_output(pigz, raw, output_path) as stream:
+                        yield stream
+                else:
+                    # Record the final file name, not the temporary one, in the gzip header
+                    with gzip.GzipFile(output_path.name, "wb", fileobj=raw) as stream:
+                        yield stream
+        else:
+            with tmp_path.open("wb", buffering=CSV_BUFFER_SIZE) as stream:
+                yield stream
+
+
+@contextmanager
+def open_output(output_path: Path) -> Iterator[TextIO]:
+    """
+    Open a UTF-8 text stream for CSV output on top of :func:`open_binary_output`.
+
+    Newline translation is off, as the csv module requires.
+    """
+    with open_binary_output(output_path) as binary:
+        stream = io.TextIOWrapper(binary, encoding="utf-8", newline="")
+        try:
+            yield stream
+        finally:
+            stream.flush()
+            # Leave closing the underlying stream (or not, for stdout) to open_binary_output
+            stream.detach()
+
+
+def write_csv(
+    output_path: Path,
+    columns: Sequence[str],
+    batches: Iterable[List[Tuple[Any, ...]]],
+) -> int:
+    """
+    Write a header and batches of rows to a CSV file.
+
+    Parameters
+    ----------
+    output_path : Path
+        Path to the output CSV file ('.gz' to compress), or '-' for stdout.
+    columns : Sequence[str]
+        Column names for the header row (skipped if empty).
+    batches : Iterable[List[Tuple[Any, ...]]]
+        Batches of rows, written as they arrive.
 
-    with output_path.open("w", newline="", encoding="utf-8") as csvfile:
+    Returns
+    -------
+    int
+        Number of rows written (excluding the header).
+    """
+    row_count = 0
+    with open_output(output_path) as csvfile:
         writer = csv.writer(csvfile)
         if columns:
             writer.writerow(columns)
-        for row in rows:
-            writer.writerow(row)
+        for rows in batches:
+            writer.writerows(rows)
+            row_count += len(rows)
+    return row_count
+
+
+def write_arrow_csv(output_path: Path, record_batches: Iterable[Any]) -> int:
+    """
+    Write Arrow RecordBatches to a CSV file using pyarrow's C++ CSV writer.
+
+    Parameters
+    ----------
+    output_path : Path
+        Path to the output CSV file ('.gz' to compress), or '-' for stdout.
+    record_batches : Iterable[pyarrow.RecordBatch]
+        Query results in columnar form, all sharing one schema.
+
+    Returns
+    -------
+    int
+        Number of rows written (excluding the header).
+    """
+    if pa_csv is None:
+        raise ImportError("pyarrow is not installed. Please install it with: pip install pyarrow")
+
+    row_count = 0
+    writer = None
+    with open_binary_output(output_path) as sink:
+        try:
+            for record_batch in record_batches:
+                if writer is None:
+                    writer = pa_csv.CSVWriter(
+                        sink,
+                        record_batch.schema,
+                        write_options=pa_csv.WriteOptions(batch_size=ARROW_CSV_BATCH_SIZE),
+                    )
+                writer.write_batch(record_batch)
+                row_count += record_batch.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+    return row_count
+
+
+def export_query(query: str, config: Mapping[str, Any], output_path: Path) -> int:
+    """
+    Run a query and write its results to a CSV file.
+
+    Parameters
+    ----------
+    query : str
+        The SQL query to execute.
+    config : Mapping[str, Any]
+        Configuration dictionary with connection settings.
+    output_path : Path
+        Path to the output CSV file, or '-' for stdout. Not created if the query returns no rows.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+    """
+    if config.get("protocol") == "thrift" or config.get("csv_writer") == "pyarrow":
+        # Results arrive as Arrow batches (columnar over Thrift, or converted from JDBC rows)
+        # and are encoded by pyarrow's C++ CSV writer as they are fetched
+        record_batches = stream_hive_query_arrow(query, config=config)
+        first_batch = next(record_batches)
+        if not first_batch.num_rows:
+            record_batches.close()
+            return 0
+        return write_arrow_csv(output_path, itertools.chain([first_batch], record_batches))
+
+    # Execute query; rows are streamed to the CSV batch by batch
+    batches = stream_hive_query(query, config=config)
+    columns, first_rows = next(batches)
+    if not first_rows:
+        batches.close()
+        return 0
+    remaining = (rows for _, rows in batches)
+    return write_csv(output_path, columns, itertools.chain([first_rows], remaining))
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    tags = args.tag or [None]
+
+    try:
+        if len(tags) > 1 and args.output:
+            raise ValueError("--output cannot be used with multiple tags; set 'output' per tag in the config")
+
+        jobs = []
+        warm_up = None
+        for tag in tags:
+            # Load configuration for the specified tag
+            config = load_config(args.config, tag=tag)
+            if warm_up is None and config.get("protocol") != "thrift":
+                # Start the JVM in the background; the first connect waits on the JVM lock
+                # only for whatever startup is still left. Not a daemon, so an early exit
+                # waits for it instead of tearing down a half-started JVM.
+                warm_up = threading.Thread(target=warm_up_jvm, args=(config,), name="jvm-warm-up")
+                warm_up.start()
+            
+            # Get query from config
+            query = get_query_from_config(config, args.config)
+            
+            # Determine output path
+            output_path = determine_output_path(config, args.config, args.output)
+            jobs.append((tag, query, config, output_path))
+
+        output_paths = [job[3] for job in jobs]
+        to_stdout = any(is_stdout(path) for path in output_paths)
+        if len(set(output_paths)) != len(output_paths):
+            raise ValueError("Several tags would write to the same output file; set 'output' per tag in the config")
+
+        # Truststore/keystore settings are JVM-wide system properties, so concurrent tags must agree on them
+        ssl_keys = {ssl_settings_key(job[2]) for job in jobs if job[2].get("protocol") != "thrift"}
+        ssl_keys.discard(None)
+        if len(ssl_keys) > 1:
+            raise ValueError("Tags with different SSL settings can't run together; run them in separate invocations")
+
+        if len(jobs) == 1:
+            _, query, config, output_path = jobs[0]
+            row_counts = [export_query(query, config, output_path)]
+        else:
+            # One worker (and pooled connection) per tag, so query wait times overlap
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [executor.submit(export_query, query, config, path) for _, query, config, path in jobs]
+                row_counts = [future.result() for future in futures]
+
+    except StdoutClosedError:
+        # The reader on the other end of stdout went away (e.g. `| head`); point stdout
+        # at devnull so the interpreter's final flush doesn't raise again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        raise SystemExit(1)
+    except Exception as exc:  # noqa: BLE001
+        logging.error("Failed to run query: %s", exc)
+        raise SystemExit(1) from exc
 
-    print(f"Query executed successfully. Wrote {len(rows)} rows to '{output_path}'.")
+    # Keep the summary out of the CSV when it went to stdout
+    summary = sys.stderr if to_stdout else sys.stdout
+    for (tag, _, _, output_path), row_count in zip(jobs, row_counts):
+        prefix = f"[{tag}] " if len(jobs) > 1 else ""
+        destination = "stdout" if is_stdout(output_path) else f"'{output_path}'"
+        if not row_count:
+            print(f"{prefix}Query executed successfully. No rows returned.", file=summary)
+        else:
+            print(f"{prefix}Query executed successfully. Wrote {row_count} rows to {destination}.", file=summary)
 
 
 if __name__ == "__main__":
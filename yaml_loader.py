@@ -0,0 +1,81 @@
+"""
+Thin wrapper around PyYAML that always picks the fastest safe loader available.
+"""
+
+from typing import Any, IO, List, Tuple, Union
+
+import yaml
+
+# Prefer the libyaml-backed C loader; fall back to the pure-Python one if PyYAML was built without it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+def safe_load(stream: Union[str, bytes, IO]) -> Any:
+    """
+    Parse a YAML document using the fastest available safe loader.
+
+    Parameters
+    ----------
+    stream : Union[str, bytes, IO]
+        YAML text or an open file object.
+
+    Returns
+    -------
+    Any
+        The parsed YAML document.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_load_entry(stream: Union[str, bytes, IO], key: Any) -> Tuple[Any, List[Any]]:
+    """
+    Parse a single entry of a top-level YAML mapping.
+
+    The whole stream is still scanned to build the node graph, but only the
+    value stored under ``key`` (and the top-level keys) are turned into Python
+    objects; every other entry is skipped.
+
+    Parameters
+    ----------
+    stream : Union[str, bytes, IO]
+        YAML text or an open file object.
+    key : Any
+        Top-level key whose value should be loaded.
+
+    Returns
+    -------
+    Tuple[Any, List[Any]]
+        The value under ``key`` (None if absent) and the list of top-level keys.
+    """
+    loader = SafeLoader(stream)
+    try:
+        root = loader.get_single_node()
+        if root is None:
+            return None, []
+        plain_keys = isinstance(root, yaml.MappingNode) and all(
+            isinstance(key_node, yaml.ScalarNode) and key_node.tag != MERGE_TAG
+            for key_node, _ in root.value
+        )
+        if not plain_keys:
+            # Merge keys or complex keys need the full constructor
+            document = loader.construct_document(root)
+            if not isinstance(document, dict):
+                return None, []
+            return document.get(key), list(document)
+
+        keys = []
+        value_node = None
+        for key_node, node in root.value:
+            node_key = loader.construct_object(key_node)
+            keys.append(node_key)
+            if node_key == key:
+                value_node = node
+        value = loader.construct_document(value_node) if value_node is not None else None
+        return value, keys
+    finally:
+        loader.dispose()